@@ -73,22 +73,27 @@ func createBenchReservationService() *reservation.Service {
 	return reservation.NewService(reservationRepo, availabilityChecker, eventPublisher)
 }
 
-func Benchmark_Server_Integration_Liveness_Should_Respond_Fast(b *testing.B) {
-	ctx := context.Background()
-	logger := logging.NewJsonLogger()
-	reservationService := createBenchReservationService()
+// newBenchServer starts a test server with the default router (no MCP endpoint)
+// and returns it together with an HTTP client. The server is closed on cleanup.
+func newBenchServer(b *testing.B) (*httptest.Server, *http.Client) {
+	b.Helper()
 	mux := inbound.Route(inbound.RouterConfig{
-		Ctx:                ctx,
+		Ctx:                context.Background(),
 		EFS:                efs,
-		Logger:             logger,
-		ReservationService: reservationService,
+		Logger:             logging.NewJsonLogger(),
+		ReservationService: createBenchReservationService(),
 	})
 	server := httptest.NewServer(mux)
-	defer server.Close()
+	b.Cleanup(server.Close)
 
 	client := &http.Client{
 		Timeout: 5 * time.Second,
 	}
+	return server, client
+}
+
+func Benchmark_Server_Integration_Liveness_Should_Respond_Fast(b *testing.B) {
+	server, client := newBenchServer(b)
 
 	for b.Loop() {
 		resp, _ := client.Get(server.URL + "/liveness")
@@ -99,21 +104,7 @@ func Benchmark_Server_Integration_Liveness_Should_Respond_Fast(b *testing.B) {
 }
 
 func Benchmark_Server_Integration_Static_CSS_Should_Serve_Fast(b *testing.B) {
-	ctx := context.Background()
-	logger := logging.NewJsonLogger()
-	reservationService := createBenchReservationService()
-	mux := inbound.Route(inbound.RouterConfig{
-		Ctx:                ctx,
-		EFS:                efs,
-		Logger:             logger,
-		ReservationService: reservationService,
-	})
-	server := httptest.NewServer(mux)
-	defer server.Close()
-
-	client := &http.Client{
-		Timeout: 5 * time.Second,
-	}
+	server, client := newBenchServer(b)
 
 	for b.Loop() {
 		resp, _ := client.Get(server.URL + "/static/css/base.css")
@@ -124,21 +115,7 @@ func Benchmark_Server_Integration_Static_CSS_Should_Serve_Fast(b *testing.B) {
 }
 
 func Benchmark_Server_Integration_Login_Page_Should_Render_Fast(b *testing.B) {
-	ctx := context.Background()
-	logger := logging.NewJsonLogger()
-	reservationService := createBenchReservationService()
-	mux := inbound.Route(inbound.RouterConfig{
-		Ctx:                ctx,
-		EFS:                efs,
-		Logger:             logger,
-		ReservationService: reservationService,
-	})
-	server := httptest.NewServer(mux)
-	defer server.Close()
-
-	client := &http.Client{
-		Timeout: 5 * time.Second,
-	}
+	server, client := newBenchServer(b)
 
 	for b.Loop() {
 		resp, _ := client.Get(server.URL + "/ui/login")